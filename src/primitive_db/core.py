@@ -5,7 +5,8 @@ from prettytable import PrettyTable
 
 from .decorators import confirm_action, handle_db_errors, log_time
 from .metadata import save_metadata
-from .utils import create_cacher, load_table_data, save_table_data
+from .storage import CODECS, read_codec, save_compressed
+from .utils import compressed_path, create_cacher, load_table_data, save_table_data
 
 SUPPORTED_TYPES = {'int', 'str', 'bool'}
 
@@ -65,11 +66,17 @@ def drop_table(metadata, table_name):
 
     # 2. Удаляем файл данных
     data_file = Path(f'data/{table_name}.json')
+    packed_file = compressed_path(table_name)
+    if not data_file.exists() and not packed_file.exists():
+        print(f'Файл данных {data_file} не найден (пропущено удаление).')
+
     if data_file.exists():
         data_file.unlink()  # Удаляем файл
         print(f'Файл данных {data_file} удалён.')
-    else:
-        print(f'Файл данных {data_file} не найден (пропущено удаление).')
+
+    if packed_file.exists():
+        packed_file.unlink()
+        print(f'Сжатый файл данных {packed_file} удалён.')
 
 
     print(f'Таблица "{table_name}" успешно удалена.')
@@ -196,6 +203,7 @@ def delete(table_data, table_name, where_clause):
 
 
 
+@handle_db_errors
 def info(metadata, table_name):
     """Выводит информацию о таблице."""
     if table_name not in metadata:
@@ -209,6 +217,45 @@ def info(metadata, table_name):
     print(f'Столбцы: {", ".join(columns)}')
     print(f'Количество записей: {len(table_data)}')
 
+    packed_file = compressed_path(table_name)
+    storage = read_codec(packed_file) if packed_file.exists() else 'json'
+    print(f'Хранение: {storage}')
+
+
+
+
+@handle_db_errors
+def compress_table(metadata, table_name, codec):
+    """
+    Переводит таблицу в сжатое хранение (zlib или lzma) или обратно в JSON.
+    Строковые столбцы кодируются словарём, данные сжимаются целиком.
+    """
+    if table_name not in metadata:
+        print(f'Ошибка: Таблица "{table_name}" не существует.')
+        return None
+
+    if codec != 'json' and codec not in CODECS:
+        print(f'Некорректное значение: {codec}. Поддерживаемые режимы: zlib, lzma, json.') # noqa: E501
+        return None
+
+    table_data = load_table_data(table_name)
+    data_file = Path(f'data/{table_name}.json')
+    packed_file = compressed_path(table_name)
+
+    if codec == 'json':
+        # Сначала пишем JSON, и только потом удаляем сжатый файл
+        with open(data_file, 'w', encoding='utf-8') as f:
+            json.dump(table_data, f, ensure_ascii=False, indent=4)
+        if packed_file.exists():
+            packed_file.unlink()
+    else:
+        save_compressed(packed_file, table_data, codec)
+        if data_file.exists():
+            data_file.unlink()
+
+    print(f'Таблица "{table_name}" теперь хранится в режиме {codec}.')
+    return table_data
+
 
 
 
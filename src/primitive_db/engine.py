@@ -1,6 +1,7 @@
 import prompt
 
 from .core import (
+    compress_table,
     create_table,
     delete,
     drop_table,
@@ -11,6 +12,7 @@ from .core import (
     select,
     update,
 )
+from .decorators import handle_db_errors
 from .metadata import load_metadata, save_metadata
 from .parser import (
     parse_delete_command,
@@ -28,6 +30,7 @@ def print_help():
     print("  create_table <имя_таблицы> <столбец1:тип> <столбец2:тип> ...")
     print("  drop_table <имя_таблицы>")
     print("  list_tables")
+    print("  compress_table <имя_таблицы> <zlib|lzma|json>")
 
     print("\n***CRUD-операции***")
     print("  insert into <таблица> values (<значение1>, <значение2>, ...)")
@@ -43,6 +46,13 @@ def print_help():
 
 
 
+@handle_db_errors
+def _load_table(table_name, where_clause=None):
+    """Загружает данные таблицы; при ошибке чтения возвращает None."""
+    return load_table_data(table_name, where_clause)
+
+
+
 def run():
     """Основной цикл программы."""
     while True:
@@ -85,6 +95,12 @@ def run():
         elif command == 'list_tables':
             list_tables(metadata)
 
+        elif command == 'compress_table':
+            if len(args) != 3:
+                print('Ошибка: укажите таблицу и режим. Пример: compress_table users zlib') # noqa: E501
+                continue
+            compress_table(metadata, args[1], args[2].lower())
+
         # --- CRUD-операции ---
         elif user_input.startswith('insert into '):
             parsed = parse_insert_command(user_input)
@@ -98,7 +114,9 @@ def run():
             parsed = parse_select_command(user_input)
             if parsed:
                 table_name, where_clause = parsed
-                table_data = load_table_data(table_name)
+                table_data = _load_table(table_name, where_clause)
+                if table_data is None:
+                    continue
                 result = select(table_data, where_clause)
                 columns = metadata.get(table_name, [])
                 print_table(result, columns)
@@ -109,7 +127,9 @@ def run():
             parsed = parse_update_command(user_input)
             if parsed:
                 table_name, set_clause, where_clause = parsed
-                table_data = load_table_data(table_name)
+                table_data = _load_table(table_name)
+                if table_data is None:
+                    continue
                 update(table_data, table_name, set_clause, where_clause)  
             else:
                 print('Ошибка синтаксиса команды update. Используйте: update <таблица> set <столбец1> = <новое_значение1> where <столбец_условия> = <значение_условия>') # noqa: E501
@@ -119,7 +139,9 @@ def run():
             parsed = parse_delete_command(user_input)
             if parsed:
                 table_name, where_clause = parsed
-                table_data = load_table_data(table_name)
+                table_data = _load_table(table_name)
+                if table_data is None:
+                    continue
                 delete(table_data, table_name, where_clause)
             else:
                 print('Ошибка синтаксиса команды delete. Используйте: delete from <таблица> where <столбец> = <значение>') # noqa: E501
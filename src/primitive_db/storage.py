@@ -0,0 +1,155 @@
+import json
+import lzma
+import zlib
+
+# Поддерживаемые кодеки сжатия (только стандартная библиотека)
+CODECS = {
+    'zlib': (zlib.compress, zlib.decompress),
+    'lzma': (lzma.compress, lzma.decompress),
+}
+
+
+def encode_columns(data):
+    """
+    Преобразует список записей в столбцовое представление.
+    Столбцы, все значения которых — строки, кодируются словарём:
+    {'dict': [уникальные значения], 'codes': [индексы в словаре]}.
+    Остальные столбцы хранятся как есть: {'values': [...]}.
+    Если столбец есть не во всех записях, номера записей без него
+    перечисляются в 'absent'.
+    """
+    names = []
+    for row in data:
+        for name in row:
+            if name not in names:
+                names.append(name)
+
+    columns = {}
+    for name in names:
+        absent = [i for i, row in enumerate(data) if name not in row]
+        values = [row.get(name) for row in data]
+        present = [v for i, v in enumerate(values) if name in data[i]]
+
+        if all(isinstance(v, str) for v in present):
+            dictionary = []
+            index = {}
+            codes = []
+            for v in values:
+                if v is None:
+                    codes.append(-1)
+                    continue
+                if v not in index:
+                    index[v] = len(dictionary)
+                    dictionary.append(v)
+                codes.append(index[v])
+            column = {'dict': dictionary, 'codes': codes}
+        else:
+            column = {'values': values}
+
+        if absent:
+            column['absent'] = absent
+        columns[name] = column
+
+    return {'rows': len(data), 'columns': columns}
+
+
+def _matching_rows(encoded, where_clause):
+    """
+    Возвращает номера записей, удовлетворяющих условию равенства.
+    Для словарных столбцов значение ищется в словаре один раз,
+    дальше сравниваются только целочисленные коды.
+    """
+    matched = range(encoded['rows'])
+    for key, value in where_clause.items():
+        column = encoded['columns'].get(key)
+        if column is None:
+            # Столбца нет ни в одной записи: row.get(key) даёт None
+            if str(value) != 'None':
+                return []
+            continue
+
+        if 'dict' in column:
+            # Код -1 — записи без этого столбца, row.get(key) даёт None
+            codes = {-1} if str(value) == 'None' else set()
+            if str(value) in column['dict']:
+                codes.add(column['dict'].index(str(value)))
+            if not codes:
+                return []
+            column_codes = column['codes']
+            matched = [i for i in matched if column_codes[i] in codes]
+        else:
+            absent = set(column.get('absent', []))
+            values = column['values']
+            matched = [
+                i for i in matched
+                if str(None if i in absent else values[i]) == str(value)
+            ]
+    return matched
+
+
+def decode_columns(encoded, where_clause=None):
+    """
+    Восстанавливает список записей из столбцового представления.
+    Если передан where_clause, собираются только подходящие записи.
+    """
+    if where_clause:
+        row_ids = _matching_rows(encoded, where_clause)
+    else:
+        row_ids = range(encoded['rows'])
+
+    columns = [
+        (name, column, set(column.get('absent', [])))
+        for name, column in encoded['columns'].items()
+    ]
+
+    data = []
+    for i in row_ids:
+        row = {}
+        for name, column, absent in columns:
+            if i in absent:
+                continue
+            if 'dict' in column:
+                row[name] = column['dict'][column['codes'][i]]
+            else:
+                row[name] = column['values'][i]
+        data.append(row)
+    return data
+
+
+def read_codec(file_path):
+    """Возвращает имя кодека из заголовка сжатого файла."""
+    with open(file_path, 'rb') as f:
+        return f.readline().decode('ascii').strip()
+
+
+def load_compressed(file_path, where_clause=None):
+    """Загружает записи из сжатого файла таблицы."""
+    with open(file_path, 'rb') as f:
+        header = f.readline()
+        payload = f.read()
+
+    try:
+        codec = header.decode('ascii').strip()
+        if codec not in CODECS:
+            raise ValueError(f'неизвестный кодек сжатия: {codec}')
+        _, decompress = CODECS[codec]
+        encoded = json.loads(decompress(payload).decode('utf-8'))
+        return decode_columns(encoded, where_clause)
+    except (zlib.error, lzma.LZMAError, ValueError, KeyError, IndexError) as e:
+        raise ValueError(f'Сжатый файл {file_path} повреждён ({e}).') from e
+
+
+def save_compressed(file_path, data, codec):
+    """
+    Сохраняет записи в сжатый файл: строка-заголовок с именем кодека,
+    затем сжатый компактный JSON со столбцовым представлением.
+    """
+    if codec not in CODECS:
+        raise ValueError(f'Неизвестный кодек сжатия: {codec}')
+    compress, _ = CODECS[codec]
+
+    encoded = json.dumps(encode_columns(data), ensure_ascii=False,
+                         separators=(',', ':'))
+    with open(file_path, 'wb') as f:
+        f.write(codec.encode('ascii') + b'\n')
+        f.write(compress(encoded.encode('utf-8')))
@@ -1,11 +1,23 @@
 import json
 from pathlib import Path
 
+from .storage import load_compressed, read_codec, save_compressed
+
 DATA_DIR = Path('data')
 
-def load_table_data(table_name):
-    """Загружает данные таблицы из data/<имя_таблицы>.json. 
+def compressed_path(table_name):
+    """Путь к сжатому файлу таблицы data/<имя_таблицы>.jsonz."""
+    return DATA_DIR / f"{table_name}.jsonz"
+
+def load_table_data(table_name, where_clause=None):
+    """Загружает данные таблицы из data/<имя_таблицы>.json
+    (или из сжатого data/<имя_таблицы>.jsonz, если он есть).
+    Для сжатой таблицы where_clause фильтрует записи по кодам словаря.
     Возвращает пустой список, если файла нет.""" 
+    packed_path = compressed_path(table_name)
+    if packed_path.exists():
+        return load_compressed(packed_path, where_clause)
+
     file_path = DATA_DIR / f"{table_name}.json"
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
@@ -14,7 +26,13 @@ def load_table_data(table_name):
         return []
 
 def save_table_data(table_name, data):
-    """Сохраняет данные таблицы в data/<имя_таблицы>.json."""
+    """Сохраняет данные таблицы в data/<имя_таблицы>.json
+    (или в сжатый файл, если таблица хранится в сжатом виде)."""
+    packed_path = compressed_path(table_name)
+    if packed_path.exists():
+        save_compressed(packed_path, data, read_codec(packed_path))
+        return
+
     file_path = DATA_DIR / f"{table_name}.json"
     with open(file_path, 'w', encoding='utf-8') as f:
         json.dump(data, f, ensure_ascii=False, indent=4)